@@ -2,4 +2,7 @@
 
 #exec "$@"
 
-uvicorn fastapi_hello_world:app --reload --host 0.0.0.0 --port 8000
+# ask for uvloop and httptools explicitly so a missing C extension fails the
+# start up instead of silently falling back to asyncio and h11
+uvicorn fastapi_hello_world:app --reload --host 0.0.0.0 --port 8000 \
+    --loop uvloop --http httptools
@@ -1,5 +1,9 @@
 from fastapi.applications import FastAPI 
 from .examples import router as examples_router
+from .responses import ORJSONResponse
+from .routing import FastPathRouter
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 app.include_router(examples_router)
+# resolve routes with a lookup table rather than scanning them one by one
+app.exception_middleware.app = FastPathRouter(app.router)
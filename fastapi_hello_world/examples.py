@@ -1,65 +1,98 @@
 from fastapi.routing import APIRouter
+from starlette.responses import Response
 
-from typing import Dict, Union
+from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, List, Optional
+
+import orjson
 
-router = APIRouter()
+from .routing import ORJSONRoute
+
+# the route_class lets you customize how the router's routes handle requests,
+# ORJSONRoute parses json request bodies with orjson
+router = APIRouter(route_class=ORJSONRoute)
 
 
 ##############################################################################
 # Path Parameters
 ##############################################################################
 # use @router.REST_VERB(PATH_NAME) to tell FastApi this is a route function
+# if the response never changes, serialize it once at import time and return
+# a Response directly.  FastAPI passes Response instances through untouched,
+# skipping jsonable_encoder and the json encoding of the response class
+_ROOT_JSON = orjson.dumps({"Hello": "World"})
+
 @router.get("/")
-async def read_root() -> Dict[str, str]:
-    return {"Hello": "World"}
+async def read_root() -> Response:
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
 
 # create path variables like this: {path_var}
 # the function will resolve it as the kwarg with the same name
 # these are naturally resolved as strings unless you use type hinting
 # in which case they are automatically converted
+# route functions declared with a plain def are run in a threadpool, so
+# prefer async def for anything that doesn't do blocking I/O
 @router.get("/items/{item_id}")
-def read_item(
+async def read_item(
     # path params will normally be passed into the function as strings
     # but if you use type hinting, they will automatically be converted
     # and documented appropriately
     item_id: int,
     # if you type hint the return values, they will be appropriately documented
-) -> Dict[str, int]:
-    return {"item_id": item_id}
+) -> Response:
+    return Response(content=_read_item_json(item_id), media_type="application/json")
 
 
-# path params support enumerations as well and will document them automatically
-from enum import Enum
+# the response only depends on the path param, so popular items can be
+# served from a cache of already serialized responses.  The bytes are built
+# by hand since orjson refuses ints outside of 64 bits
+@lru_cache(maxsize=10_000)
+def _read_item_json(item_id: int) -> bytes:
+    return b'{"item_id":%d}' % item_id
 
 
+# path params support enumerations as well and will document them automatically
 class ModelName(str, Enum):
     alexnet = "alexnet"
     resnet = "resnet"
     lenet = "lenet"
 
 
+# you could compare the path param with each enumeration member (or its
+# value) in turn, but the members can also be used as dict keys, which makes
+# a dispatch table with one lookup per request
+_MODEL_MESSAGES: Dict[ModelName, str] = {
+    ModelName.alexnet: "Deep Learning FTW!",
+    ModelName.lenet: "LeCNN all the images",
+    ModelName.resnet: "Have some residuals",
+}
+
+# and since the responses are static they can be serialized up front
+_MODEL_RESPONSES: Dict[ModelName, bytes] = {
+    model_name: orjson.dumps({"model_name": model_name.value, "message": message})
+    for model_name, message in _MODEL_MESSAGES.items()
+}
+
 @router.get("/model/{model_name}")
 # just be sure to type-hint the enumerated type
-async def get_model(model_name: ModelName) -> Dict[str, str]:
-    # you can compare the path param with the enumeration member
-    if model_name == ModelName.alexnet:
-        return {"model_name": model_name, "message": "Deep Learning FTW!"}
-    # or compare the value directly
-    if model_name.value == "lenet":
-        return {"model_name": model_name, "message": "LeCNN all the images"}
-    return {"model_name": model_name, "message": "Have some residuals"}
+async def get_model(model_name: ModelName) -> Response:
+    return Response(
+        content=_MODEL_RESPONSES[model_name], media_type="application/json"
+    )
 
 
 ##############################################################################
 # Query Parameters
 ##############################################################################
-from typing import Optional
+_HELLO_WORLD_JSON = orjson.dumps({"hello": "world"})
 
 # parameters passed into route functions that don't have corresponding path
 # params will be interpreted as query params
 @router.get("/query_params/")
-def get_query(
+async def get_query(
     # query params get resolved as strings unless type-hinted
     # and are considered "required" unless given a default value
     # set the default value to None if truly optional
@@ -69,8 +102,8 @@ def get_query(
     my_boolean_query_param: bool = False,
     # use Optional from typing for truly optional params
     my_optional_param: Optional[int] = None,
-) -> Dict[str, str]:
-    return {"hello": "world"}
+) -> Response:
+    return Response(content=_HELLO_WORLD_JSON, media_type="application/json")
 
 
 # so if the path is
@@ -95,9 +128,11 @@ class MyRequestBody(BaseModel):
 
 # then just type-hint your param as the name of your new type
 # FastAPI will implicitly interpret that as a request body
+# returning the model itself works, but FastAPI then runs it through the
+# (slow) jsonable_encoder.  A model of plain fields can go straight to orjson
 @router.post("/request_body/")
-async def post_body(body: MyRequestBody) -> MyRequestBody:
-    return body
+async def post_body(body: MyRequestBody) -> Response:
+    return Response(content=orjson.dumps(body.dict()), media_type="application/json")
 
 # if you have a single body param, the api will expect a body that looks like:
 # {
@@ -112,8 +147,10 @@ async def post_body(body: MyRequestBody) -> MyRequestBody:
 async def post_body_multiple(
     body_1: MyRequestBody, 
     body_2: MyRequestBody
-) -> MyRequestBody:
-    return body_1
+) -> Response:
+    return Response(
+        content=orjson.dumps(body_1.dict()), media_type="application/json"
+    )
 
 # will expect a body that looks like:
 # {
@@ -129,7 +166,6 @@ async def post_body_multiple(
 
 # use pydantic's Field method to setup validation for your request body models
 from pydantic import Field
-from typing import Any
 
 class MyValidatedRequestBody(BaseModel):
     name: str = Field(None, title="The name of the item", max_length=300)
@@ -138,7 +174,6 @@ class MyValidatedRequestBody(BaseModel):
 # you have access to all the same validation and metadata fields as shown below
 
 # model fields can be subtypes:
-from typing import List
 class MySpecificSubtypeRequestBody(BaseModel):
     name: str
     price: float
@@ -160,13 +195,15 @@ class MyRequestBodyWithNestedTypeList(BaseModel):
     tags: List[str] = []
 
 # if you are expecting a list of your model you can specify that directly in
-# the route function parameters:
+# the route function parameters.  Clients with many items to send should
+# batch them through a route like this, the per request overhead (routing,
+# dependency solving, encoding the response) is then paid once per batch
 @router.post("/request_body_list/")
 async def post_body_list(
     *,
     bodys: List[MyRequestBody]
-) -> Dict[str, str]:
-    return {"hello": "world"}
+) -> Response:
+    return Response(content=_HELLO_WORLD_JSON, media_type="application/json")
 
 # you may want to use a regular dict in lieu of a pydantic model.  The primary
 # reason for this would if you need arbitrary keys:
@@ -241,7 +278,6 @@ async def get_explicit_query(
 # even if you aren't using any metadata, explicitly specifying the type of 
 # param is sometimes necessary.  If you want to use a query param that is a 
 # list:
-from typing import List
 @router.get("/query_list/")
 async def get_query_list(
     # without explicitly stating this is a query, the param: query_list would be 
@@ -275,8 +311,8 @@ async def get_query_list(
 @router.post("/request_body_embed/")
 async def post_body_embed(
     body: MyRequestBody = Body(..., embed=True)
-) -> Dict[str, str]:
-    return {"hello": "world"}
+) -> Response:
+    return Response(content=_HELLO_WORLD_JSON, media_type="application/json")
 
 
 ##############################################################################
@@ -358,9 +394,19 @@ async def post_response_model(body: MyRequestBody) -> MyResponseModel:
 #  add a json schema for the response, in the openAPI path operation
 #  generate automatic documentation
 #  *limit the output data to that of the model
-# the return type of the function will not necessarily be the response_model, 
+# the return type of the function will not necessarily be the response_model,
 # it could be a regular dict, but it will be automatically converted
 
+##############################################################################
+# QUICK TIP - The return type hints on the route functions are only for the
+#             editor and mypy, FastAPI does not use them to validate anything.
+#             Only routes with a response_model pay for validating the
+#             response (a second pydantic pass on top of jsonable_encoder),
+#             so leave it off of routes that return trusted data.
+#             Returning a Response directly skips both the validation and
+#             the encoding, the response_model is then only documentation
+##############################################################################
+
 # we might have an input and output version of the same model for security
 # purposes
 class UserIn(BaseModel):
@@ -390,16 +436,22 @@ async def create_user(*, user: UserIn) -> UserIn:
 # some special arguments to the path operation decorator
 
 # if you have default values in your response_model and only want to send
-# the data that was actually set you can use response_model_exclude_unset
-@router.post(
-    "/user_no_defaults_in_response/", 
-    response_model=UserOut,
-    response_model_exclude_unset=True
-)
+# the data that was actually set you can pass response_model_exclude_unset=True
+# to the path operation decorator.  That has FastAPI validate the response
+# against the response_model and then filter it while encoding, which is
+# about the slowest way to produce a response.  pydantic's dict() can do the
+# same filtering directly, leaving the response_model for the documentation.
+# Include only UserOut's fields so a field added to UserIn later can't leak
+@router.post("/user_no_defaults_in_response/", response_model=UserOut)
 async def create_user_no_defaults_in_response(
     user: UserIn
-) -> UserIn:
-    return user
+) -> Response:
+    return Response(
+        content=orjson.dumps(
+            user.dict(include=set(UserOut.__fields__), exclude_unset=True)
+        ),
+        media_type="application/json",
+    )
 
 # now if the user declines to set their full name, it won't show up in the
 # response.  Note that if the user sets their full name to the default value
@@ -491,9 +543,13 @@ items = [
     {"name": "Red", "description": "It's my aeroplane"},
 ]
 
+_ITEMS_JSON = orjson.dumps(items)
+
+# the response_model is still used to document the endpoint, but since we
+# return a Response it is not used to validate the (static) items
 @router.get("/items_list/", response_model=List[Item])
-async def get_item_list() -> List[Dict[str, str]]:
-    return items
+async def get_item_list() -> Response:
+    return Response(content=_ITEMS_JSON, media_type="application/json")
 
 ##############################################################################
 # Response Status Code
@@ -564,27 +620,41 @@ async def create_big_file(file: UploadFile = File(...)) -> Dict[str, str]:
 # a list of bytes or a list of UploadFile 
 @router.post("/files_multiple/")
 async def create_files(files: List[bytes] = File(...)) -> Dict[str, List[int]]:
-    return {"file_sizes": [len(file) for file in files]}
+    return {"file_sizes": list(map(len, files))}
 
-@router.post("files_multiple_big/")
+@router.post("/files_multiple_big/")
 async def create_big_files(
     files: List[UploadFile] = File(...)
 ) -> Dict[str,List[str]]:
-    return {"filenames": [file.filename for file in files]}
+    return {"filenames": list(map(attrgetter("filename"), files))}
 
 ##############################################################################
 # Handling Errors
 ##############################################################################
-# to return HTTP responses with errors raise an HTTPException
-from fastapi.exceptions import HTTPException
-
+# to return HTTP responses with errors raise an HTTPException:
+#     from fastapi.exceptions import HTTPException
+#     raise HTTPException(status_code=404, detail="Item not found")
+# FastAPI's exception handler turns it into a {"detail": ...} json response.
+# For errors that are expected to be common, like a lookup missing, it is
+# cheaper to return that response directly instead of raising
 items_exception = {"foo": "The Foo Wrestlers"}
 
+_ITEMS_EXCEPTION_JSON = {
+    item_id: orjson.dumps({"item": item})
+    for item_id, item in items_exception.items()
+}
+_ITEM_NOT_FOUND_JSON = orjson.dumps({"detail": "Item not found"})
+
 @router.get("/items_exception/{item_id}")
-async def get_item_exception( item_id: str) -> Dict[str, str]:
-    if item_id not in items_exception:
-        raise HTTPException(status_code=404, detail="Item not found")
-    return {"item": items_exception[item_id]}
+async def get_item_exception( item_id: str) -> Response:
+    item_json = _ITEMS_EXCEPTION_JSON.get(item_id)
+    if item_json is None:
+        return Response(
+            content=_ITEM_NOT_FOUND_JSON,
+            status_code=404,
+            media_type="application/json",
+        )
+    return Response(content=item_json, media_type="application/json")
 
 
 
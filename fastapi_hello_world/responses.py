@@ -0,0 +1,18 @@
+from typing import Any
+
+import orjson
+from starlette.responses import JSONResponse
+
+
+# starlette only ships json and ujson backed responses, so we provide an
+# orjson backed one that can be used as the app's default_response_class
+class ORJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        try:
+            return orjson.dumps(content)
+        except orjson.JSONEncodeError:
+            # orjson refuses some content json.dumps accepts, e.g. non-str
+            # dict keys (Dict[int, float]) or ints outside of 64 bits
+            return super().render(content)
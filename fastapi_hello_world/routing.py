@@ -0,0 +1,100 @@
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+import orjson
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Match, Route, Router
+from starlette.types import Receive, Scope, Send
+
+RouteMatch = Tuple[Route, Dict[str, Any]]
+RouteHandler = Callable[[Request], Awaitable[Response]]
+
+
+# starlette resolves every request by walking the route list and matching
+# each route's regex in turn.  This wraps a router and resolves http requests
+# with a dict lookup for the static paths and an lru_cache for the dynamic
+# ones, only falling back to the router for anything else (404s, 405s,
+# redirects, websockets and lifespan)
+# build it after all the routers have been included
+class FastPathRouter:
+    def __init__(self, router: Router, cache_size: int = 4096) -> None:
+        self.router = router
+        self._match_dynamic = lru_cache(maxsize=cache_size)(self._scan)
+        self.static_routes: Dict[Tuple[str, str], Route] = {}
+        for route in router.routes:
+            if not isinstance(route, Route) or route.param_convertors:
+                continue
+            # starlette only assigns Route.methods inside an if/else, which
+            # leaves mypy unable to infer its type, so look it up by name
+            methods: Optional[Set[str]] = getattr(route, "methods")
+            for method in methods or ():
+                # an earlier route may shadow this one, so only take the
+                # shortcut if the normal scan would have picked this route
+                match = self._scan(method, route.path)
+                if match is not None and match[0] is route:
+                    self.static_routes[(method, route.path)] = route
+
+    # the match the router's scan would find, or None if it would not end
+    # in a full match on a plain Route
+    def _scan(self, method: str, path: str) -> Optional[RouteMatch]:
+        scope = {"type": "http", "method": method, "path": path}
+        for route in self.router.routes:
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                if isinstance(route, Route):
+                    return route, child_scope["path_params"]
+                return None
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            key = (scope["method"], scope["path"])
+            route: Optional[Route] = self.static_routes.get(key)
+            path_params: Dict[str, Any] = {}
+            if route is None:
+                match = self._match_dynamic(*key)
+                if match is not None:
+                    route, path_params = match
+            if route is not None:
+                if "router" not in scope:
+                    scope["router"] = self.router
+                # copy the cached params, the scope is handed to user code
+                scope.update(endpoint=route.endpoint, path_params=dict(path_params))
+                await route(scope, receive, send)
+                return
+        await self.router(scope, receive, send)
+
+
+# FastAPI reads json request bodies with request.json(), which uses json.loads
+class ORJSONRequest(Request):
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+# use as the route_class of an APIRouter to have its routes decode request
+# bodies with orjson
+class ORJSONRoute(APIRoute):
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        # starlette only names routes after plain python functions, which the
+        # endpoints aren't once examples.py is compiled with cython
+        if kwargs.get("name") is None:
+            kwargs["name"] = endpoint.__name__
+        super().__init__(path, endpoint, **kwargs)
+
+    def get_route_handler(self) -> RouteHandler:
+        original_route_handler: RouteHandler = super().get_route_handler()
+        # FastAPI only reads the body of routes that declare one, so the
+        # others can skip building a second request object
+        if self.body_field is None:
+            return original_route_handler
+
+        async def orjson_route_handler(request: Request) -> Response:
+            request = ORJSONRequest(request.scope, request.receive)
+            response: Response = await original_route_handler(request)
+            return response
+
+        return orjson_route_handler
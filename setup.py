@@ -1,3 +1,21 @@
 from setuptools import setup, find_packages
 
-setup(name="PACKAGENAME", packages=find_packages())
+# compile the route module with cython when it is available.  binding=True
+# keeps the compiled functions introspectable, which FastAPI relies on to
+# read the route signatures, and annotation_typing=False stops cython from
+# enforcing the annotations since FastAPI puts e.g. Cookie() in the defaults
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        ["fastapi_hello_world/examples.py"],
+        compiler_directives={
+            "language_level": 3,
+            "binding": True,
+            "annotation_typing": False,
+        },
+    )
+
+setup(name="PACKAGENAME", packages=find_packages(), ext_modules=ext_modules)
@@ -0,0 +1,26 @@
+import json
+
+from pytest_bdd import given, then, parsers
+
+
+@given(
+    parsers.parse('the user makes a {method} request to "{path}"'),
+    target_fixture="response",
+)
+def request_path(client, method, path):
+    return client.request(method, path, allow_redirects=False)
+
+@given(
+    parsers.parse('the user posts {body} to "{path}"'),
+    target_fixture="response",
+)
+def post_json(client, body, path):
+    return client.post(path, json=json.loads(body), allow_redirects=False)
+
+@then(parsers.parse('the server responds with status {status_code:d}'))
+def verify_status_code(response, status_code):
+    assert response.status_code == status_code
+
+@then(parsers.parse('the response json is {body}'))
+def verify_json(response, body):
+    assert response.json() == json.loads(body)
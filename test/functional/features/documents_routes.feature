@@ -0,0 +1,10 @@
+Feature: Application Documents Its Routes
+  as a developer,
+  I want the generated docs to be named after the route functions
+  So I can tell compiling the routes didn't break the documentation
+
+  Scenario: Operations are named after their route functions
+    Given the user makes a GET request to "/openapi.json"
+    Then the server responds with status 200
+    And the operation id of GET "/" is "read_root__get"
+    And the operation id of POST "/request_body/" is "post_body_request_body__post"
@@ -0,0 +1,19 @@
+Feature: Application Echoes Any Valid Input
+  as a developer,
+  I want routes that echo their input to accept anything that validates
+  So I can tell the faster json encoding didn't narrow what the api accepts
+
+  Scenario: Dict keys outside of 64 bits are echoed back
+    Given the user posts {"123456789012345678901234567890": 1.5} to "/request_body_dict_instead_of_model/"
+    Then the server responds with status 200
+    And the response json is {"123456789012345678901234567890": 1.5}
+
+  Scenario: Item ids above 64 bits are echoed back
+    Given the user makes a GET request to "/items/18446744073709551616"
+    Then the server responds with status 200
+    And the response json is {"item_id": 18446744073709551616}
+
+  Scenario: Item ids below 64 bits are echoed back
+    Given the user makes a GET request to "/items/-9223372036854775809"
+    Then the server responds with status 200
+    And the response json is {"item_id": -9223372036854775809}
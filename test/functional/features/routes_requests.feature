@@ -0,0 +1,30 @@
+Feature: Application Routes Requests Like Starlette Does
+  as a developer,
+  I want requests to reach the same routes with or without the fast path
+  So I can tell the route lookup table didn't change which route runs
+
+  Scenario: A method the route doesn't allow is rejected
+    Given the user makes a POST request to "/"
+    Then the server responds with status 405
+
+  Scenario: A missing trailing slash is redirected
+    Given the user makes a GET request to "/items_list"
+    Then the server responds with status 307
+    And the response redirects to "http://testserver/items_list/"
+
+  Scenario: An unknown path is not found
+    Given the user makes a GET request to "/not_a_route/"
+    Then the server responds with status 404
+
+  Scenario: A static route shadowed by an earlier dynamic route stays shadowed
+    Given an app that declares "/things/{name}" before "/things/special"
+    And the user makes a GET request to "/things/special"
+    Then the server responds with status 200
+    And the response json is {"route": "dynamic", "name": "special"}
+
+  Scenario: Path params cached for a dynamic route are not shared
+    Given an app whose route changes its path params
+    And the user has already made a GET request to "/things/foo"
+    And the user makes a GET request to "/things/foo"
+    Then the server responds with status 200
+    And the response json is {"name": "foo"}
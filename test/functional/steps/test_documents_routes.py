@@ -0,0 +1,9 @@
+from pytest_bdd import scenarios, parsers, then
+
+
+scenarios('../features/documents_routes.feature')
+
+@then(parsers.parse('the operation id of {method} "{path}" is "{operation_id}"'))
+def verify_operation_id(response, method, path, operation_id):
+    operation = response.json()["paths"][path][method.lower()]
+    assert operation["operationId"] == operation_id
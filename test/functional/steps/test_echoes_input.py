@@ -0,0 +1,4 @@
+from pytest_bdd import scenarios
+
+
+scenarios('../features/echoes_input.feature')
@@ -0,0 +1,56 @@
+from typing import Dict
+
+from fastapi.applications import FastAPI
+from fastapi.routing import APIRouter
+from pytest_bdd import scenarios, parsers, given, then
+from starlette.requests import Request
+from starlette.testclient import TestClient
+
+from fastapi_hello_world.routing import FastPathRouter
+
+
+scenarios('../features/routes_requests.feature')
+
+# wire the router up to an app the same way fastapi_hello_world does
+def wrapped_client(router):
+    app = FastAPI()
+    app.include_router(router)
+    app.exception_middleware.app = FastPathRouter(app.router)
+    return TestClient(app)
+
+@given(
+    'an app that declares "/things/{name}" before "/things/special"',
+    target_fixture="client",
+)
+def shadowing_client():
+    router = APIRouter()
+
+    @router.get("/things/{name}")
+    async def dynamic_thing(name: str) -> Dict[str, str]:
+        return {"route": "dynamic", "name": name}
+
+    @router.get("/things/special")
+    async def static_thing() -> Dict[str, str]:
+        return {"route": "static"}
+
+    return wrapped_client(router)
+
+@given('an app whose route changes its path params', target_fixture="client")
+def path_param_changing_client():
+    router = APIRouter()
+
+    @router.get("/things/{name}")
+    async def change_thing(request: Request) -> Dict[str, str]:
+        path_params = dict(request.path_params)
+        request.path_params["name"] = "changed"
+        return path_params
+
+    return wrapped_client(router)
+
+@given(parsers.parse('the user has already made a GET request to "{path}"'))
+def earlier_request(client, path):
+    client.get(path)
+
+@then(parsers.parse('the response redirects to "{url}"'))
+def verify_redirect(response, url):
+    assert response.headers["location"] == url